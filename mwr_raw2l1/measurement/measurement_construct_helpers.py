@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 import xarray as xr
 
 from mwr_raw2l1.errors import DimensionError, MissingInputArgument, TimeMismatch
@@ -156,43 +157,105 @@ def make_dataset(data, dims, vars, vars_opt=None, multidim_vars=None, time_vecto
             shape_act = [len(data[dims[k]]) for k in range(ndims_per_var[var])]
             data[var] = np.full(shape_act, missing_val)
 
-    # add optional variables as NaN-series to data if not in input data
-    for varo in vars_opt:
-        if varo not in data:
-            shape_act = [len(data[dims[k]]) for k in range(ndims_per_var[varo])]
-            data[varo] = np.full(shape_act, missing_val)
-            logger.info('Optional variable {} not found in input data. Will create a all-NaN placeholder'.format(varo))
-
-    # collect specifications and data for generating xarray Dataset from dict
-    spec = {}
-    for dim in dims:
-        spec[dim] = dict(dims=dim, data=data[dim])
-    # add vars to spec
+    # add optional variables as NaN-series to data if not in input data. Placeholders of same shape share one read-only
+    # buffer instead of allocating a new array for each missing variable
+    nan_templates = {}
+    missing_opt = set(vars_opt).difference(data)  # one set operation, empty on the common path of complete data
+    if missing_opt:
+        missing_opt = [varo for varo in vars_opt if varo in missing_opt]  # keep order of vars_opt
+        for varo in missing_opt:
+            shape_act = tuple(len(data[dims[k]]) for k in range(ndims_per_var[varo]))
+            if shape_act not in nan_templates:
+                nan_templates[shape_act] = np.full(shape_act, missing_val)
+                nan_templates[shape_act].setflags(write=False)
+            data[varo] = nan_templates[shape_act]
+        logger.info('Optional variables {} not found in input data. Will create all-NaN placeholders'.format(
+            ', '.join(missing_opt)))
+
+    # collect coordinates and data variables for constructing the xarray Dataset directly (faster than from_dict)
+    coords = {dim: (dim, data[dim]) for dim in dims}
+    n_dims = len(dims)
+    dim_prefixes = [tuple(dims[:nd]) for nd in range(n_dims + 1)]  # dims tuple of a variable indexed by its ndim
+    data_vars = {}
     for var in all_vars:
-        nd = np.ndim(data[var])
-        if nd > len(dims):
+        arr = data[var]
+        nd = arr.ndim if isinstance(arr, np.ndarray) else np.ndim(arr)  # attribute lookup avoids np.ndim dispatch
+        if nd > n_dims:
             raise DimensionError(dims, var, nd)
-        spec[var] = dict(dims=dims[0:nd], data=data[var])
+        data_vars[var] = (dim_prefixes[nd], arr)
 
-    return xr.Dataset.from_dict(spec)
+    return xr.Dataset(data_vars=data_vars, coords=coords)
 
 
-def to_single_dataset(data_dicts, *args, **kwargs):
+def to_single_dataset(data_dicts, dims, vars, vars_opt=None, **kwargs):
     """return a single :class:`xarray.Dataset` with unique time vector from a list of data dictionaries
 
+    The arrays of all data dictionaries are concatenated along time before generating one single dataset. Only if the
+    non-time dimensions differ between the dictionaries a dataset is made for each of them and merged by xarray.
+
     Args:
         data_dicts: list of data dictionaries to be concatenated to a time series
-        *args: dimension and variable specifications passed on to :func:`make_dataset`
-        **kwargs: dimension and variable specifications passed on to :func:`make_dataset`
+        dims: list of keys that are a dimension, passed on to :func:`make_dataset`
+        vars: list of keys that are data variables, passed on to :func:`make_dataset`
+        vars_opt (optional): list of keys that are optional data variables, passed on to :func:`make_dataset`
+        **kwargs: further specifications passed on to :func:`make_dataset`
     """
-    datasets = []
-    for dat in data_dicts:
-        datasets.append(make_dataset(dat, *args, **kwargs))
-    out = xr.concat(datasets, dim='time')  # merge all datasets of the same type
+    data = concat_data_dicts(data_dicts, dims, vars, vars_opt)
+    if data is None:
+        datasets = [make_dataset(dat, dims, vars, vars_opt, **kwargs) for dat in data_dicts]
+        out = xr.concat(datasets, dim='time')  # merge all datasets of the same type
+    else:
+        out = make_dataset(data, dims, vars, vars_opt, **kwargs)
     out = drop_duplicates(out, dim='time')  # remove duplicate measurements
     return out
 
 
+def concat_data_dicts(data_dicts, dims, vars, vars_opt=None):
+    """concatenate the time series of a list of data dictionaries to a single data dictionary
+
+    Optional variables missing in some of the dictionaries are filled with NaN for the corresponding times. Optional
+    variables missing in all dictionaries are omitted (and left to be filled by :func:`make_dataset`).
+
+    Args:
+        data_dicts: list of data dictionaries to be concatenated along their first dimension (time)
+        dims: list of keys that are a dimension. The first one is assumed to be time
+        vars: list of keys that are data variables (time as first dimension)
+        vars_opt (optional): list of keys that are optional data variables (time as first dimension)
+    Returns:
+        data dictionary or None if the non-time dimensions differ between the dictionaries or if a variable is scalar
+    """
+    if vars_opt is None:
+        vars_opt = []
+    n_time = [len(dat[dims[0]]) for dat in data_dicts]
+
+    out = {}
+    for dim in dims[1:]:
+        out[dim] = data_dicts[0][dim]
+        for dat in data_dicts[1:]:
+            if np.shape(dat[dim]) != np.shape(out[dim]) or not np.array_equal(dat[dim], out[dim], equal_nan=True):
+                return None
+
+    for var in [dims[0]] + vars + vars_opt:
+        present = [var in dat for dat in data_dicts]
+        if var in vars_opt:
+            if not any(present):
+                continue
+        elif not all(present):
+            raise KeyError(var)
+        template = data_dicts[present.index(True)][var]
+        if np.ndim(template) == 0:
+            return None
+        # NaN-fill with the dtype of the present data (if float) so that concatenation does not need to upcast
+        fill_dtype = np.asarray(template).dtype
+        if not np.issubdtype(fill_dtype, np.floating):
+            fill_dtype = np.float64
+        parts = [dat[var] if pres else np.full((n,) + np.shape(template)[1:], np.nan, fill_dtype)
+                 for dat, pres, n in zip(data_dicts, present, n_time)]
+        out[var] = parts[0] if len(parts) == 1 else np.concatenate(parts)  # no copy needed for single file
+
+    return out
+
+
 def merge_aux_data(mwr_data, all_data, srcs_to_ignore=None):
     """merge auxiliary data to time grid of microwave data
 
@@ -237,10 +300,29 @@ def drop_duplicates(ds, dim):
         ds with unique dimension vector
     """
 
-    _, ind = np.unique(ds[dim], return_index=True)  # keep first index but assume duplicate values identical anyway
+    ind = unique_first_index(ds[dim].values)  # keep first index but assume duplicate values identical anyway
     return ds.isel({dim: ind})
 
 
+def unique_first_index(x):
+    """return the indices of the first occurrence of each unique element in x ordered by value like :func:`numpy.unique`
+
+    Args:
+        x: 1d :class:`numpy.ndarray`
+    Returns:
+        :class:`numpy.ndarray` of indices
+    """
+    if x.size > 1 and (x[1:] >= x[:-1]).all():  # already sorted (usual case): first occurrences in one linear pass
+        keep = np.empty(x.size, dtype=bool)
+        keep[0] = True
+        np.not_equal(x[1:], x[:-1], out=keep[1:])
+        return np.nonzero(keep)[0]
+    # hashtable lookup on a new index instead of sorting all values. Not using the index held by xarray as its
+    # duplicated() misses duplicates after is_monotonic_increasing has been evaluated on an index containing NaT
+    ind = np.nonzero(~pd.Index(x).duplicated(keep='first'))[0]
+    return ind[np.argsort(x[ind], kind='stable')]  # order by value like for sorted input
+
+
 def merge_brt_blb(all_data):
     """merge brt (zenith MWR) and blb (scanning MWR) observations from an RPG instrument
 
@@ -27,18 +27,23 @@ def scan_endtime_to_time(endtime, n_angles, time_per_angle=17):
 
     if isinstance(endtime, dt.datetime):
         endtime = np.array([endtime])
-        def timedelta_method(seconds): return dt.timedelta(seconds=seconds)
+        delta = np.array([dt.timedelta(seconds=n * time_per_angle) for n in reversed(range(n_angles))])
     else:
-        def timedelta_method(seconds):
-            # use ms as timedelta needs int. Will truncate to ms what should also avoid rounding errors in tests
-            return np.timedelta64(int(seconds*1000), 'ms')
-
-    delta = [timedelta_method(n * time_per_angle) for n in reversed(range(n_angles))]
-    delta = np.array(delta)
-
-    endtime = endtime.reshape(len(endtime), 1)  # for letting numpy broadcast along dimension 1
-    time = endtime - delta  # calculate time for each scan position (matrix)
-    time = time.reshape((-1,))  # make one-dimenional vector out of time matrix
+        # use ms as timedelta needs int. Will truncate to ms what should also avoid rounding errors in tests
+        delta = (np.arange(n_angles - 1, -1, -1) * time_per_angle * 1000).astype(np.int64).astype('timedelta64[ms]')
+
+    # calculate time for each scan position (matrix) broadcasting along dimension 1 directly into C-ordered output
+    time = np.empty((len(endtime), n_angles), dtype=np.result_type(endtime, delta))
+    if np.issubdtype(time.dtype, np.datetime64):
+        # convert once to common unit and subtract as plain int64 to avoid unit conversions in the subtraction itself
+        unit = np.datetime_data(time.dtype)[0]
+        endtime = endtime.astype(time.dtype, copy=False).view(np.int64)
+        delta = delta.astype('timedelta64[{}]'.format(unit)).view(np.int64)
+        np.subtract(endtime[:, np.newaxis], delta, out=time.view(np.int64))
+        time[endtime == np.iinfo(np.int64).min] = np.datetime64('NaT')  # int64 arithmetic does not propagate NaT
+    else:
+        np.subtract(endtime[:, np.newaxis], delta, out=time)
+    time = time.reshape((-1,))  # make one-dimenional vector out of time matrix (view, no copy)
 
     return time
 
@@ -57,21 +62,24 @@ def scantime_from_aux(blb, hkd=None, brt=None):
         :class`datetime.datetime` objects
     """
 
-    time_scan = blb['time'].values
-    n_ele = len(blb['scan_ele'].values)
+    time_scan = blb['time'].values  # access .values of xarray objects only once
+    n_ele = blb['scan_ele'].size
 
     endtime2time_params = dict(endtime=time_scan, n_angles=n_ele)
     if hkd is not None and 'BLscan_active' in hkd:
-        time_scan_active = hkd.time[hkd.BLscan_active.values == 1].values
-        time_zen_active = hkd.time[hkd.BLscan_active.values == 0].values
-
-        if len(blb.time) > 1:  # more than one scan in blb. sure that last one is complete
-            time_last_scan_active = time_scan_active[
-                np.logical_and(time_scan_active > blb.time[-2].values, time_scan_active <= blb.time[-1].values)]
+        time_hkd = hkd['time'].values
+        scan_active = hkd['BLscan_active'].values
+        time_scan_active = time_hkd[scan_active == 1]
+        time_zen_active = time_hkd[scan_active == 0]
+
+        if len(time_scan) > 1:  # more than one scan in blb. sure that last one is complete
+            # time_scan_active is monotonic, hence the window of the last scan can be found by binary search
+            ind_start, ind_end = np.searchsorted(time_scan_active, time_scan[-2:], side='right')
+            time_last_scan_active = time_scan_active[ind_start:ind_end]
             scan_duration = timedelta2s(time_last_scan_active[-1] - time_last_scan_active[0])
             endtime2time_params['time_per_angle'] = scan_duration / n_ele
         elif time_scan_active[0] > time_zen_active[0]:  # sure to have full scan at beginning of hkd
-            scan_duration = timedelta2s(blb.time[0].values - time_scan_active[0])
+            scan_duration = timedelta2s(time_scan[0] - time_scan_active[0])
             endtime2time_params['time_per_angle'] = scan_duration / n_ele
         else:
             logger.warning(
@@ -79,9 +87,11 @@ def scantime_from_aux(blb, hkd=None, brt=None):
     elif brt is not None:
         # less accurate than hkd because things happen before scan starts (e.g. ambload obs).
         # Assume after last hkd measure it takes 2x time_per_angle before first scanobs ends.
-        if brt.time[0] < blb.time[-1]:
-            diff_end_blb_brt = timedelta2s(
-                blb.time[-1].values - brt.sel(time=blb['time'][-1], method='pad').time.values)
+        time_brt = brt['time'].values
+        if time_brt[0] < time_scan[-1]:
+            # time of last brt obs before or at end of last scan (equivalent to sel with method='pad' on sorted time)
+            time_brt_pad = time_brt[np.searchsorted(time_brt, time_scan[-1], side='right') - 1]
+            diff_end_blb_brt = timedelta2s(time_scan[-1] - time_brt_pad)
             endtime2time_params['time_per_angle'] = diff_end_blb_brt / (n_ele+2)
         else:
             logger.warning(
@@ -115,8 +125,8 @@ def scan_to_timeseries(scanobs, time_all_angles):
         # 3-dimensional variables (time, freq, ele_dim)
         if len(scanobs[var].dims) == 3 and \
                 scanobs[var].dims[-1] == ele_dim and scanobs[var].dims[0] == time_dim:
-            var_tmp = var_tmp.swapaxes(0, 1)  # swap dim to (xxx, time, ele) where xxx is usually frequency
-            var_tmp = var_tmp.reshape(-1, n_scans * n_ele, order='C').transpose()
+            var_tmp = var_tmp.transpose(0, 2, 1)  # to (time, ele, xxx) where xxx is usually frequency
+            var_tmp = var_tmp.reshape(n_scans * n_ele, -1)  # single copy to C-contiguous (time_tmp, xxx)
             dims_act = ('time_tmp', scanobs[var].dims[1])
         # 1-dimensional variables (time, )
         elif len(scanobs[var].dims) == 1 and scanobs[var].dims[0] == time_dim:
@@ -130,7 +140,7 @@ def scan_to_timeseries(scanobs, time_all_angles):
 
     # reshape elevation remove as dimension and assign as variable
     ele_tmp = scanobs[ele_dim].values
-    ele_tmp = np.tile(ele_tmp, n_scans)
+    ele_tmp = np.broadcast_to(ele_tmp[np.newaxis, :], (n_scans, n_ele)).reshape(-1)  # like np.tile, one allocation
     scanobs = scanobs.drop_dims(ele_dim)
     scanobs = scanobs.assign({'ele': (('time_tmp',), ele_tmp)})
 
@@ -191,17 +201,7 @@ def scan_to_timeseries_from_dict(data, *args, **kwargs):
         *args: Auxiliary observations
         **kwargs: Auxiliary observations
     """
-    n_freq = data['n_freq']
-    n_ele = data['n_ele']
-    n_scans = data['n_scans']
-
-    tb_tmp = data['Tb'].swapaxes(0, 1)  # swap dim to (freq, time, ele)
-    data['Tb'] = tb_tmp.reshape(n_freq, n_scans * n_ele, order='C').transpose()
-
-    data['T'] = data['T'].repeat(n_ele)  # repeat to have one T value for each new time
-
-    # transform single vector of elevations to time series of elevations
-    data['ele'] = np.tile(data['scan_ele'], data['n_scans'])
+    data['Tb'], data['T'], data['ele'] = flatten_scan(data['Tb'], data['T'], data['scan_ele'])
 
     # time is encoded as end time of scan (same time for all elevations).
     data['time'] = scan_endtime_to_time(data['time'], data['n_ele'])
@@ -209,6 +209,25 @@ def scan_to_timeseries_from_dict(data, *args, **kwargs):
     return data
 
 
+def flatten_scan(tb, t, scan_ele):
+    """flatten Tb of scans to time series of spectra and expand T and ele to the same time series
+
+    Args:
+        tb: brightness temperatures of scans as :class:`numpy.ndarray` with dimensions (time, freq, ele)
+        t: ambient temperature of scans as :class:`numpy.ndarray` with dimension (time, )
+        scan_ele: elevation angles of scans as :class:`numpy.ndarray` with dimension (ele, )
+    Returns:
+        tuple of Tb with dimensions (time*ele, freq), T and ele with dimension (time*ele, )
+    """
+    n_scans, n_freq, n_ele = tb.shape
+
+    tb_out = np.ascontiguousarray(tb.transpose(0, 2, 1)).reshape(n_scans * n_ele, n_freq)
+    # broadcast_to is a view, the reshape materialises it exactly once (no intermediate arrays as for tile)
+    t_out = np.broadcast_to(t[:, np.newaxis], (n_scans, n_ele)).reshape(-1)
+    ele_out = np.broadcast_to(scan_ele[np.newaxis, :], (n_scans, n_ele)).reshape(-1)
+    return tb_out, t_out, ele_out
+
+
 def scanflag_from_ele(ele, use_ele_diff=False):
     """infer scanflag (0: starring; 1: scanning) from elevation vector
 
@@ -2,6 +2,7 @@ import csv
 import os
 
 import numpy as np
+import pandas as pd
 
 from mwr_raw2l1.errors import FileFormatError, MissingHeader, MissingData, MissingVariable
 from mwr_raw2l1.log import logger
@@ -28,7 +29,7 @@ class Reader(object):
             csv_lines = csv.reader(f, delimiter='\t')
             self._read_header(csv_lines)
             if not header_only:
-                self._read_data(csv_lines)
+                self._read_data(f)  # csv_lines has consumed the header lines of f
                 self.data_raw_to_np()
 
     def _read_header(self, csv_lines):
@@ -45,20 +46,26 @@ class Reader(object):
         if not self.header['col_header']:
             raise MissingHeader('No column header has been found')
 
-    def _read_data(self, csv_lines):
-        for line in csv_lines:
-            self.data_raw.append(line)
+    def _read_data(self, f):
+        # parse the remaining lines of the open file in one go with the C parser of pandas. Time (first column) is kept
+        # as string, the numeric columns are converted to float already here (round_trip: same values as float(str)).
+        # End of file character is treated as comment so that it does not prevent numeric columns from being float
+        try:
+            self.data_raw = pd.read_csv(f, sep='\t', header=None, dtype={0: str}, na_filter=False, comment='\x1a',
+                                        float_precision='round_trip')
+        except pd.errors.EmptyDataError:
+            raise MissingData('Data section in input file is empty')
 
         # remove final line if not printable, e.g. end of file character. (make sure data_raw is not already empty)
-        if self.data_raw and not self.data_raw[-1][0].isprintable():
-            del self.data_raw[-1]
+        if not self.data_raw.empty and not self.data_raw.iat[-1, 0].isprintable():
+            self.data_raw = self.data_raw.iloc[:-1]
 
-        if not self.data_raw:
+        if self.data_raw.empty:
             raise MissingData('Data section in input file is empty')
 
     def data_raw_to_np(self):  # trivial for Attex but keep function for analogy to Radiometrcs
         """in-place replacement for self.data_raw to a numpy array"""
-        self.data_raw = np.array(self.data_raw)
+        self.data_raw = self.data_raw.to_numpy()
 
     def interpret_data(self):
         """fill up self.data using self.data_raw and self.header"""
@@ -1,9 +1,11 @@
-import datetime as dt
+from functools import lru_cache
 
-import numpy as np
+import pandas as pd
 
 from mwr_raw2l1.errors import MissingVariable, WrongInputFormat
 
+SIMPLIFY_HEADER_TABLE = str.maketrans({' ': None, '[': '(', ']': ')'})  # replacements done by simplify_header
+
 
 def get_time(data_raw, header, header_time, date_format):
     """extract time from data_raw using header
@@ -12,13 +14,14 @@ def get_time(data_raw, header, header_time, date_format):
         data_raw: raw data as :class:`numpy.ndarray` object
         header: column header belonging to data_raw
         header_time: the pattern for matching the time variable in the header
-        date_format: format how the date is encoded in the string. Used by :class:`datetime.datetime`
+        date_format: format how the date is encoded in the string. Uses the directives of :meth:`datetime.strptime`
     Returns:
-        a :class:`numpy.ndarray` of :class:`datetime.datetime` objects
+        a :class:`numpy.ndarray` of :class:`numpy.datetime64` in ns
     """
 
     ind = get_column_ind(header, header_time)
-    return np.array([dt.datetime.strptime(tt, date_format) for tt in data_raw[:, ind]])
+    # parse whole column at once instead of calling strptime for each line
+    return pd.to_datetime(data_raw[:, ind], format=date_format).values
 
 
 def get_column_ind(header, column_title):
@@ -31,8 +34,9 @@ def get_column_ind(header, column_title):
         the index of the column corresponding to column_title
     """
 
+    column_title_simple = simplify_header(column_title)  # only simplify once, not for every header entry
     for ind, hd in enumerate(header):
-        if simplify_header(hd) == simplify_header(column_title):
+        if simplify_header(hd) == column_title_simple:
             return ind
 
 
@@ -43,9 +47,10 @@ def check_vars(data, mandatory_vars):
             raise MissingVariable("Mandatory variable '{}' was not found in data".format(var))
 
 
+@lru_cache(maxsize=1024)  # the same few header strings are compared over and over again
 def simplify_header(str_in):
     """simplify strings to match col headers more robustly. Use on both sides of the '==' operator"""
-    return str_in.lower().replace(' ', '').replace('[', '(').replace(']', ')')
+    return str_in.lower().translate(SIMPLIFY_HEADER_TABLE)
 
 
 def check_input_filelist(files):
@@ -1,7 +1,12 @@
 import csv
+import io
+import itertools
 import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
+import pandas as pd
 
 from mwr_raw2l1.errors import EmptyLineError, MissingData, MissingHeader, UnknownRecordType, CorruptRectype
 from mwr_raw2l1.log import logger
@@ -9,6 +14,9 @@ from mwr_raw2l1.readers.reader_helpers import check_input_filelist, check_vars
 from mwr_raw2l1.readers.reader_radiometrics_helpers import get_data, get_record_type
 from mwr_raw2l1.utils.file_utils import abs_file_path
 
+IND_RECORD_TYPE = 2  # index of the record type number in each csv line
+N_COLS_EXTRA = 10  # number of fields a data line may have in excess of the longest column header
+
 
 class Reader(object):
     def __init__(self, filename):
@@ -29,7 +37,7 @@ class Reader(object):
             csv_lines = csv.reader(f, delimiter=',')
             self._read_header(csv_lines)
             if not header_only:
-                self._read_data(csv_lines)
+                self._read_data(f)  # csv_lines has consumed the header lines and the first data line of f
                 self.data_raw_to_np()
 
     def interpret_data(self):
@@ -86,80 +94,124 @@ class Reader(object):
         if not self.header['col_headers']:
             raise MissingHeader('No column header has been found')
 
-    def _read_data(self, csv_lines):
+    def _read_data(self, f):
         """read data section of the csv data and relate to header. Assume header has been read before"""
 
-        # init corresponding list of lines
-        for rec_type_nb in self.header['col_headers'].keys():
-            self.data_raw[rec_type_nb] = []
-
-        # iterate over csv_lines assuming header has already been read (incl. first data line)
+        # first line of data section has already been consumed together with the header
+        first_lines = []
         try:
-            self.sort_data_line(self.header['first_line_data'])
+            self.get_header_rec_type(self.header['first_line_data'])
+            first_lines.append(self.header['first_line_data'])
         except UnknownRecordType:
             logger.warning('first line after header is ignored as it does not correspond to expected format of data')
         except EmptyLineError:
             pass  # silently ignore empty line after header
 
-        # ct_corrupt_lines = 0
-        for line in csv_lines:
-            try:
-                self.sort_data_line(line)
-            except EmptyLineError:
-                continue  # ignore empty lines and continue with next
-        # if rectype is corrupt also previous line is likely to be corrupt, hence do not escape this situation
-        #     except CorruptRectype:
-        #         ct_corrupt_lines += 1
-        #         continue
-        # if ct_corrupt_lines > 0:
-        #     logger.warning('Ignored {} corrupt lines in {}'.format(ct_corrupt_lines, self.filename))
-
-    def sort_data_line(self, line):
-        """attribute a csv line of the data section to the correct header reference"""
+        # parse all remaining lines at once with the C parser of pandas directly from the file instead of sorting them
+        # line by line. Lines of the different record types have different lengths, hence pad all to a fixed number of
+        # columns exceeding the longest header. Empty fields and padding are set to NaN directly by the parser
+        n_cols = max([len(col_header) for col_header in self.header['col_headers'].values()]
+                     + [len(line) for line in first_lines]) + N_COLS_EXTRA
+        try:
+            lines_remaining = read_data_lines(f, n_cols)
+        except pd.errors.ParserError:  # some line is longer than n_cols, e.g. of a record type without column header
+            with open(self.filename, newline='') as f_retry:  # re-read data section after first line with exact width
+                data_section = ''.join(itertools.islice(f_retry, self.header['n_lines'] + 1, None))
+            n_cols = max(line.count(',') for line in data_section.splitlines()) + 1
+            lines_remaining = read_data_lines(io.StringIO(data_section), n_cols)
+
+        lines = pd.DataFrame(first_lines)
+        lines = lines.where(lines != '')  # empty fields to NaN also for first line (already consumed by csv reader)
+        if lines_remaining is not None:
+            lines = pd.concat([lines, lines_remaining], ignore_index=True) if first_lines else lines_remaining
+        if lines.empty:
+            return
+
+        # check record types of all lines at once. Raise error for first line not matching any header like when sorting
+        rec_type_raw = lines[IND_RECORD_TYPE].fillna('').str.strip()
+        ind_corrupt = ~rec_type_raw.str.fullmatch(r'[+-]?\d+').to_numpy(dtype=bool)
+        rec_type_nb = rec_type_raw.where(~ind_corrupt, '0').astype(int).to_numpy()
+        # corresponding header rec type nb is always 1 lower e.g. 50 is header for data with nb 51
+        ind_bad = ind_corrupt | ~np.isin(rec_type_nb - 1, list(self.header['col_headers']))
+        if ind_bad.any():
+            self.get_header_rec_type(lines.iloc[ind_bad.argmax()].fillna('').tolist())  # raises the adequate error
+
+        lines = lines.to_numpy()
+        for rec_type_nb_header, col_header in self.header['col_headers'].items():
+            dat = lines[rec_type_nb == rec_type_nb_header + 1]
+            # cut padding but keep all columns with data (also if lines are longer than header)
+            cols_with_data = np.flatnonzero(pd.notna(dat).any(axis=0))
+            n_cols_rec = max(len(col_header), cols_with_data[-1] + 1 if cols_with_data.size else 0)
+            self.data_raw[rec_type_nb_header] = dat[:, :n_cols_rec]
+
+    def get_header_rec_type(self, line):
+        """get the record type number of the header corresponding to a csv line of the data section"""
         rec_type_nb = get_record_type(line)
         # corresponding header rec type nb is always 1 lower e.g. 50 is header for data with nb 51
         rec_type_nb_header = (rec_type_nb - 1)
-        if rec_type_nb_header in self.data_raw:
-            self.data_raw[rec_type_nb_header].append(line)
-        else:
+        if rec_type_nb_header not in self.header['col_headers']:
             raise UnknownRecordType('Found data with record type number {} but no header with record type number {} '
                                     'which was assumed to correspond'.format(rec_type_nb, rec_type_nb_header))
+        return rec_type_nb_header
 
     def data_raw_to_np(self):
-        """transform data_raw to a dictionary with values of :class:`numpy.ndarray` and remove entries without data"""
-        empty_rec = []
-        for rec_type, dat in self.data_raw.items():
-            if not dat:
-                empty_rec.append(rec_type)
-                continue
-            x = np.array(dat)
-            x[x == ''] = np.nan
-            self.data_raw[rec_type] = x
-        for rec_type in empty_rec:
-            del self.data_raw[rec_type]
-
-
-def read_multiple_files(files):
+        """remove entries without data from data_raw (values are already :class:`numpy.ndarray` with NaN if empty)"""
+        self.data_raw = {rec_type: dat for rec_type, dat in self.data_raw.items() if dat.size}
+
+
+def read_data_lines(f, n_cols):
+    """parse csv lines in file object f to :class:`pandas.DataFrame` of str with n_cols columns (NaN if empty/missing)
+
+    Returns:
+        :class:`pandas.DataFrame` or None if f does not contain any non-empty line
+    Raises:
+        :class:`pandas.errors.ParserError` if a line has more than n_cols fields
+    """
+    with warnings.catch_warnings():
+        # if the first line is too long pandas would only warn and drop its excess fields (or with the default
+        # index_col=None use the leading fields as index, shifting all columns), hence make this an error
+        warnings.simplefilter('error', pd.errors.ParserWarning)
+        try:
+            return pd.read_csv(f, header=None, names=range(n_cols), index_col=False, dtype=str, keep_default_na=False,
+                               na_values=[''])
+        except pd.errors.EmptyDataError:
+            return None
+        except pd.errors.ParserWarning as err:
+            raise pd.errors.ParserError(str(err))
+
+
+def read_single_file(file):
+    """read a single file with :class:`Reader` and return the executed read-in class instance"""
+    reader_inst = Reader(file)
+    reader_inst.run()
+    return reader_inst
+
+
+def read_multiple_files(files, max_workers=1):
     """read multiple L1-related files and return list of executed read-in class instances
 
     Args:
         files: list of files to read in
+        max_workers (optional): number of processes reading files in parallel. If 1 files are read sequentially in the
+            current process. None uses as many processes as there are processors. Defaults to 1.
     Returns:
         list of instances of executed read-in classes of :class:`Reader`.
     """
 
     check_input_filelist(files)
-    all_data = []
+    files_to_read = []
     for file in files:
         suffix = os.path.splitext(file)[0].split('_')[-1]
         if suffix.lower() == 'lv1':
-            reader_inst = Reader(file)
-            reader_inst.run()
-            all_data.append(reader_inst)
+            files_to_read.append(file)
         else:
             logger.warning("Cannot read {} as no reader is specified for files with suffix '{}'".format(file, suffix))
 
-    return all_data
+    if max_workers == 1:
+        return [read_single_file(file) for file in files_to_read]
+    # files are independent, read-in instances only hold header and interpreted data when returned from the workers
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(read_single_file, files_to_read))
 
 
 if __name__ == '__main__':
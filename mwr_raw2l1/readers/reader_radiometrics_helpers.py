@@ -44,11 +44,14 @@ def get_simple_vars(data_raw, header):
     # rec type 50 (mwr)
     # Az(deg),El(deg),TkBB(K),Ch....,DataQuality
 
+    # map simplified column headers to variable names once, then a single pass over the header suffices
+    colheader2var = {simplify_header(colhead): varname for varname, colhead in var2colheader.items()}
+
     data = {}
     for ind, hd in enumerate(header):
-        for varname, colhead in var2colheader.items():
-            if simplify_header(hd) == simplify_header(colhead):
-                data[varname] = data_raw[:, ind].astype(float)
+        varname = colheader2var.get(simplify_header(hd))
+        if varname is not None:
+            data[varname] = data_raw[:, ind].astype(float)
     return data
 
 
@@ -2,12 +2,14 @@
 readers for the different binary files from RPG radiometers (HATPRO, TEMPRO or HUMPRO)
 """
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
 import numpy as np
 
 from mwr_raw2l1.errors import WrongFileType, WrongNumberOfChannels
 from mwr_raw2l1.log import logger
-from mwr_raw2l1.readers.reader_rpg_base import BaseReader
+from mwr_raw2l1.readers.reader_rpg_base import BaseReader, encoding_to_key, get_dtype
 from mwr_raw2l1.readers.reader_rpg_helpers import (interpret_hkd_contents_code, interpret_met_auxsens_code,
                                                    interpret_scanflag, interpret_statusflag)
 
@@ -70,15 +72,12 @@ class BLB(BaseReader):
 
     def _read_header_1(self):
         """Function for reading header for files with structver 1 (n_freq first assumed and read only afterwards)"""
-        # quantities with fixed length
-        encodings_bin_fix = [
-            dict(name='n_scans', type='i', shape=(1,))]
-        self.decode_binary(encodings_bin_fix)
-
-        # quantities with length dependent on number of spectral channels (n_freq) only possible after n_freq is read
+        # quantities with fixed length and with length dependent on number of spectral channels (n_freq). As n_freq is
+        # not read from file but assumed here, they can be decoded in one go
         self.data['n_freq'] = N_FREQ_DEFAULT  # need assumption as number of channels is encoded after used for read
         n_freq = self.data['n_freq']
         encodings_bin_var_1 = [
+            dict(name='n_scans', type='i', shape=(1,)),
             dict(name='Tb_min', type='f', shape=(n_freq,)),
             dict(name='Tb_max', type='f', shape=(n_freq,)),
             dict(name='timeref', type='i', shape=(1,)),
@@ -249,6 +248,35 @@ class MET(BaseReader):
         self.decode_binary_np(encodings_bin, self.data['n_meas'])
 
 
+@lru_cache(maxsize=64)  # 6 content bits give at most 64 different layouts
+def get_hkd_meas_dtype(hkd_contents_code):
+    """return structured :class:`numpy.dtype` of one HKD measurement for the contents code given in the HKD header"""
+    contents = interpret_hkd_contents_code(hkd_contents_code)
+
+    encodings_bin = [
+        dict(name='time_raw', type='i', shape=(1,)),
+        dict(name='alarm', type='B', shape=(1,))]
+    if contents['has_coord']:
+        encodings_bin.append(dict(name='lon_raw', type='f', shape=(1,)))
+        encodings_bin.append(dict(name='lat_raw', type='f', shape=(1,)))
+    if contents['has_T']:
+        encodings_bin.append(dict(name='T_amb_1', type='f', shape=(1,)))
+        encodings_bin.append(dict(name='T_amb_2', type='f', shape=(1,)))
+        encodings_bin.append(dict(name='T_receiver_hum', type='f', shape=(1,)))
+        encodings_bin.append(dict(name='T_receiver_temp', type='f', shape=(1,)))
+    if contents['has_stability']:
+        encodings_bin.append(dict(name='Tstab_hum', type='f', shape=(1,)))
+        encodings_bin.append(dict(name='Tstab_temp', type='f', shape=(1,)))
+    if contents['has_flashmemoryinfo']:
+        encodings_bin.append(dict(name='flashmemory_remaining', type='i', shape=(1,)))
+    if contents['has_qualityflag']:
+        encodings_bin.append(dict(name='L2_qualityflag', type='i', shape=(1,)))
+    if contents['has_statusflag']:
+        encodings_bin.append(dict(name='statusflag', type='i', shape=(1,)))
+
+    return get_dtype(encoding_to_key(encodings_bin))
+
+
 class HKD(BaseReader):
     def interpret_filecode(self):
         super(HKD, self).interpret_filecode()
@@ -269,39 +297,28 @@ class HKD(BaseReader):
         self.data.update(file_contents)  # add variables 'has_...' used below to the data dictionary
 
     def _read_meas(self):
-        encodings_bin = [
-            dict(name='time_raw', type='i', shape=(1,)),
-            dict(name='alarm', type='B', shape=(1,))]
-        if self.data['has_coord']:
-            encodings_bin.append(dict(name='lon_raw', type='f', shape=(1,)))
-            encodings_bin.append(dict(name='lat_raw', type='f', shape=(1,)))
-        if self.data['has_T']:
-            encodings_bin.append(dict(name='T_amb_1', type='f', shape=(1,)))
-            encodings_bin.append(dict(name='T_amb_2', type='f', shape=(1,)))
-            encodings_bin.append(dict(name='T_receiver_hum', type='f', shape=(1,)))
-            encodings_bin.append(dict(name='T_receiver_temp', type='f', shape=(1,)))
-        if self.data['has_stability']:
-            encodings_bin.append(dict(name='Tstab_hum', type='f', shape=(1,)))
-            encodings_bin.append(dict(name='Tstab_temp', type='f', shape=(1,)))
-        if self.data['has_flashmemoryinfo']:
-            encodings_bin.append(dict(name='flashmemory_remaining', type='i', shape=(1,)))
-        if self.data['has_qualityflag']:
-            encodings_bin.append(dict(name='L2_qualityflag', type='i', shape=(1,)))
-        if self.data['has_statusflag']:
-            encodings_bin.append(dict(name='statusflag', type='i', shape=(1,)))
-
-        self.decode_binary_np(encodings_bin, self.data['n_meas'])
+        dtype_meas = get_hkd_meas_dtype(self.data['hkd_contents_code'])  # same layout for all files of an instrument
+        self.decode_binary_np(dtype_meas, self.data['n_meas'])
 
     def interpret_raw_data(self):
         super(HKD, self).interpret_raw_data()
         self.data.update(interpret_statusflag(self.data['statusflag']))
 
 
-def read_multiple_files(files):
+def read_single_file(reader_class, file):
+    """read a single file with reader_class and return the executed read-in class instance"""
+    reader_inst = reader_class(file)
+    reader_inst.run()
+    return reader_inst
+
+
+def read_multiple_files(files, max_workers=1):
     """read multiple L1-related files and return dictionary of executed read-in class instances
 
     Args:
         files: list of files to read in
+        max_workers (optional): number of processes reading files in parallel. If 1 files are read sequentially in the
+            current process. None uses as many processes as there are processors. Defaults to 1.
     Returns:
         dictionary with keys brt, blb, irt, met, hkd containing list with all read-in class instances for the
         corresponding file extension matching basename and the timing requirement. If no file of the corresponding type
@@ -312,15 +329,26 @@ def read_multiple_files(files):
     reader_for_ext = {'brt': BRT, 'blb': BLB, 'irt': IRT, 'met': MET, 'hkd': HKD}
 
     all_data = {name: [] for name in reader_for_ext}  # use file extension as name for list of instances of reader type
+    exts_to_read = []
+    files_to_read = []
     for file in files:
         ext = os.path.splitext(file)[1].lower()[1:]  # omit dot from extension
         if ext in reader_for_ext:
-            reader_inst = reader_for_ext[ext](file)
-            reader_inst.run()
-            all_data[ext].append(reader_inst)
+            exts_to_read.append(ext)
+            files_to_read.append(file)
         else:
             logger.warning('Cannot read {} as no reader is specified for files with extension "{}"'.format(file, ext))
 
+    reader_classes = [reader_for_ext[ext] for ext in exts_to_read]
+    if max_workers == 1:
+        reader_insts = map(read_single_file, reader_classes, files_to_read)
+    else:  # files are independent, read-in instances only hold the decoded data dict when returned from the workers
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            reader_insts = list(executor.map(read_single_file, reader_classes, files_to_read))
+
+    for ext, reader_inst in zip(exts_to_read, reader_insts):
+        all_data[ext].append(reader_inst)
+
     return all_data
 
 
@@ -330,14 +358,10 @@ def main():
 
     filename_noext = os.path.splitext('data/rpg/0-20000-0-06610' + base_filename)[0]
 
-    brt = BRT(filename_noext + '.BRT')
-    blb = BLB(filename_noext + '.BLB')
-    irt = IRT(filename_noext + '.IRT')
-    met = MET(filename_noext + '.MET')
-    hkd = HKD(filename_noext + '.HKD')
-
-    for reader_inst in [brt, blb, irt, met, hkd]:
-        reader_inst.run()
+    # the files are independent, hence read them in one process per file type
+    files = [filename_noext + ext for ext in ['.BRT', '.BLB', '.IRT', '.MET', '.HKD']]
+    all_data = read_multiple_files(files, max_workers=len(files))
+    brt, blb, irt, met, hkd = (all_data[ext][0] for ext in ['brt', 'blb', 'irt', 'met', 'hkd'])
 
     # # generate new pickle of the read-in data
     # dir_pickle = 'tests/data/rpg/'
@@ -347,13 +371,6 @@ def main():
     #     outfile = dir_pickle + '/' + base_filename + '_' + varname + '.pkl'
     #     pickle_dump(var.data, outfile)  # only store data dict in pickle
 
-    # # legacy readers
-    # brt_old = read_brt(filename_noext + '.BRT')
-    # blb_old = read_blb(filename_noext + '.BLB')
-    # irt_old = read_irt(filename_noext + '.IRT')
-    # met_old = read_met(filename_noext + '.MET')
-    # hkd_old = read_hkd(filename_noext + '.HKD')
-
 
 if __name__ == '__main__':
     from mwr_raw2l1.utils.file_utils import abs_file_path, get_files
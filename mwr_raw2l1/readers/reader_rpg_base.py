@@ -1,4 +1,5 @@
-import struct
+import mmap
+from functools import lru_cache
 
 import numpy as np
 
@@ -30,6 +31,22 @@ FILETYPE_CONFS = {  # assign metadata to each known filecode
 }
 
 
+@lru_cache(maxsize=256)
+def get_dtype(encoding_key, byte_order=BYTE_ORDER):
+    """return structured :class:`numpy.dtype` for an encoding pattern. Cached as the same patterns recur for each file
+
+    Args:
+        encoding_key: tuple of (name, type, shape) tuples describing the variables like the dicts of encoding patterns
+        byte_order (optional): byte order character prepended to each type. Defaults to BYTE_ORDER
+    """
+    return np.dtype([(name, byte_order + type_char, shape) for name, type_char, shape in encoding_key])
+
+
+def encoding_to_key(encoding_pattern):
+    """transform encoding pattern (list of dicts) to a hashable key for :func:`get_dtype`"""
+    return tuple((enc['name'], enc['type'], tuple(enc['shape'])) for enc in encoding_pattern)
+
+
 class BaseReader(object):
     def __init__(self, filename, accept_localtime=False):
         self.filename = filename
@@ -43,8 +60,12 @@ class BaseReader(object):
     def run(self):
         """do whole read-in from files and interpretation and checking of data"""
         logger.info('Reading data from ' + self.filename)
-        self.data_bin = get_binary(self.filename)
-        self.read()  # fills self.data
+        self.data_bin = get_binary(self.filename, use_mmap=True)  # avoid copying whole file to memory before decoding
+        try:
+            self.read()  # fills self.data
+        finally:
+            if isinstance(self.data_bin, mmap.mmap):  # release file handle, self.data does not refer to data_bin
+                self.data_bin.close()
         self.check_data()
         del self.data_bin  # after read() all contents of data_bin have been interpreted to data
         del self.byte_offset  # after read() has checked that all data have been read, this quantity is useless
@@ -70,15 +91,21 @@ class BaseReader(object):
             encoding_pattern: a list of tuples or lists containing the individual variable description
                 e.g. [dict(name='n_meas', type='i', shape=(1,)), dict(name='Tb', type='f', shape=(n_freq,)), ...]
         """
-        for enc in encoding_pattern:
-            full_type = byte_order + np.prod(enc['shape']) * enc['type']
-            out = struct.unpack_from(full_type, self.data_bin, self.byte_offset)
-            self.byte_offset += struct.calcsize(full_type)  # multiplication with shape already done for full type
+        # decode all variables at once as a single record of a structured dtype
+        dtype_np = get_dtype(encoding_to_key(encoding_pattern), byte_order)
+        if len(self.data_bin) < self.byte_offset + dtype_np.itemsize:
+            err_msg = 'file {} is too short to contain the expected header'.format(self.filename)
+            logger.error(err_msg)
+            raise FileTooShort(err_msg)
+        rec = np.frombuffer(self.data_bin, dtype=dtype_np, count=1, offset=self.byte_offset)[0]
+        self.byte_offset += dtype_np.itemsize
 
-            if len(out) == 1:  # extract from tuple if it has only one element, otherwise return tuple
-                self.data[enc['name']] = out[0]
+        for enc in encoding_pattern:
+            out = rec[enc['name']]
+            if out.size == 1:  # extract scalar if it has only one element, otherwise return tuple
+                self.data[enc['name']] = out.item()
             else:
-                self.data[enc['name']] = out
+                self.data[enc['name']] = tuple(out.tolist())
 
     def decode_binary_np(self, encoding_pattern, n_entries, byte_order=BYTE_ORDER):
         """decode from binary stream via :class:`numpy.ndarray` to write to dict self.data + augment self.byte_offset
@@ -86,25 +113,28 @@ class BaseReader(object):
         Args:
             encoding_pattern: a list of tuples or lists containing the individual variable description for one time step
                 e.g. [dict(name='time_raw', type='i', shape=(1,)), dict(name='Tb', type='f', shape=(n_freq,)), ...]
+                Alternatively the corresponding structured :class:`numpy.dtype` (e.g. from :func:`get_dtype`) can be
+                given directly, in which case byte_order is ignored.
         """
-        dtype_np = np.dtype([(ep['name'], byte_order+ep['type'], ep['shape']) for ep in encoding_pattern])
-        names = [ep['name'] for ep in encoding_pattern]
-        bytes_per_var = np.array([struct.calcsize(ep['type']) * np.prod(ep['shape']) for ep in encoding_pattern])
+        if isinstance(encoding_pattern, np.dtype):
+            dtype_np = encoding_pattern
+        else:
+            dtype_np = get_dtype(encoding_to_key(encoding_pattern), byte_order)
 
         byte_offset_start = self.byte_offset
-        n_bytes = bytes_per_var.sum() * n_entries
+        n_bytes = dtype_np.itemsize * n_entries  # structured dtype is packed without padding like the binary file
         self.byte_offset += n_bytes
         if len(self.data_bin) < self.byte_offset:
             err_msg = 'number of bytes in file {} does not match the one inferred from n_meas'.format(self.filename)
             logger.error(err_msg)
             raise FileTooShort(err_msg)
 
-        arr = np.frombuffer(self.data_bin[byte_offset_start: self.byte_offset], dtype=dtype_np)
-        for idx, name in enumerate(names):
-            if encoding_pattern[idx]['shape'] == (1,):  # variables which only have a time dimension shall not be 2d
-                self.data[name] = arr[name].flatten()
-            else:
-                self.data[name] = arr[name]
+        # read directly from data_bin at offset without copying a slice of it first
+        arr = np.frombuffer(self.data_bin, dtype=dtype_np, count=n_entries, offset=byte_offset_start)
+        # variables which only have a time dimension shall not be 2d. Copy each field to an owned contiguous array so
+        # that no view on the record array keeps data_bin (and the file behind it) alive after read-in
+        self.data.update({name: (arr[name][:, 0] if dtype_np[name].shape == (1,) else arr[name]).copy()
+                          for name in dtype_np.names})
 
     def interpret_filecode(self):
         """assign configuration for read in of file with corresponding file code"""
@@ -153,8 +183,14 @@ class BaseReader(object):
 
     def _read_filecode(self):
         """read filecode from binary data. first of the _read... methods to be executed (according to order in file)"""
-        self.filecode = struct.unpack_from('<i', self.data_bin, self.byte_offset)[0]
-        self.byte_offset += 4
+        n_bytes = 4  # filecode is a single int32
+        if len(self.data_bin) < self.byte_offset + n_bytes:
+            err_msg = 'file {} is too short to contain a filecode'.format(self.filename)
+            logger.error(err_msg)
+            raise FileTooShort(err_msg)
+        self.filecode = int.from_bytes(self.data_bin[self.byte_offset:self.byte_offset + n_bytes], 'little',
+                                       signed=True)
+        self.byte_offset += n_bytes
 
     def _read_header(self):
         """read header from binary data. second of the _read... methods to be executed (according to order in file)"""
@@ -1,29 +1,25 @@
 """
 helper functions for the module reader_rpg
 """
-import datetime as dt
-
 import numpy as np
 
-from mwr_raw2l1.errors import UnknownFlagValue, WrongInputFormat
+from mwr_raw2l1.errors import UnknownFlagValue
+from mwr_raw2l1.utils.num_utils import isbitset
 
+RPG_EPOCH = np.datetime64('2001-01-01T00:00:00', 'ns')  # reference of RPG time encoding (seconds since then in UTC)
 
-def interpret_time(time_in):
-    """translate the time format of RPG files to datetime object"""
-    # offset between RPG and POSIX time in seconds. Care: datetime base must be in UTC, hence tzinfo muxt be given.
-    posix_offset = dt.datetime.timestamp(dt.datetime(2001, 1, 1, tzinfo=dt.timezone(dt.timedelta(0))))
 
-    scalar_input = False
-    if np.isscalar(time_in):
-        time_in = np.array([time_in])
-        scalar_input = True
+def interpret_time(time_in):
+    """translate the time format of RPG files (seconds since 2001-01-01 UTC) to :class:`numpy.datetime64` in ns"""
+    time_in = np.asarray(time_in)
+    scalar_input = time_in.ndim == 0
+    time_in = np.atleast_1d(time_in)  # view, no copy of array input
 
-    times = [dt.datetime.utcfromtimestamp(x + posix_offset) for x in time_in]
-    out = np.array(times)
+    # vectorised offset of all times to RPG epoch. Resolution of us like for datetime conversion of fractional seconds
+    out = RPG_EPOCH + np.round(time_in * 1e6).astype(np.int64).astype('timedelta64[us]')
 
     if scalar_input:
-        out = out[0]
-
+        return out[0]
     return out
 
 
@@ -38,29 +34,25 @@ def interpret_angle(x, version):
     Returns:
         elevation, azimuth
     """
-    scalar_input = False
-    if np.isscalar(x):
-        x = np.array([x])
-        scalar_input = True
+    x = np.asarray(x)
+    scalar_input = x.ndim == 0
+    x = np.atleast_1d(x)  # view, no copy of array input
 
     if version == 1:
-        ele_offset = np.zeros(x.shape)
         ind_offset_corr = (x >= 1e6)
-        ele_offset[ind_offset_corr] = 100
-        x[ind_offset_corr] -= 1e6
+        x = np.where(ind_offset_corr, x - 1e6, x)  # don't modify input in place, it can be a read-only view
 
         azi = (np.abs(x) // 100) / 10  # assume azi and ele are measured in 0.1 degree steps
-        ele = x - np.sign(x) * azi * 1000 + ele_offset
+        ele = x - np.sign(x) * azi * 1000 + np.where(ind_offset_corr, 100., 0.)  # offset without zeros+fill pass
     elif version == 2:
-        ele = np.sign(x) * (np.abs(x) // 1e5) / 100
-        azi = (np.abs(x) - np.abs(ele) * 1e7) / 100
+        x_abs = np.abs(x)  # only compute once as needed for both ele and azi
+        ele = np.sign(x) * (x_abs // 1e5) / 100
+        azi = (x_abs - np.abs(ele) * 1e7) / 100
     else:
         raise NotImplementedError('Known versions for angle encoding are 1 and 2, but received {:f}'.format(version))
 
     if scalar_input:
-        ele = ele[0]
-        azi = azi[0]
-
+        return ele[0], azi[0]
     return ele, azi
 
 
@@ -79,10 +71,9 @@ def interpret_coord(x, version=2):
     """
 
     if version == 1:
-        degabs = np.abs(x) // 100
-        minabs = np.abs(x) - degabs * 100
+        degabs, minabs = np.divmod(np.abs(x), 100)  # degrees and minutes in one pass
         return np.sign(x) * (degabs + minabs / 60)
-    elif version == 2:
+    elif version == 2:  # nothing to compute, return input as is
         return x
     else:
         raise NotImplementedError('Known versions for coordinates encoding are 1 and 2, but received {:f}'.format(
@@ -91,16 +82,16 @@ def interpret_coord(x, version=2):
 
 def interpret_met_auxsens_code(auxsenscode):
     """interpret integer code for the availability of auxiliary sensors in MET files, return dict of contents vars"""
-    auxsenscode_int8 = np.uint8(auxsenscode)
-    auxsensbits = np.unpackbits(auxsenscode_int8, bitorder='little')
-    if auxsensbits is None:
-        out = {'has_windspeed': 0,
-               'has_winddir': 0,
-               'has_rainrate': 0}
-    else:
-        out = {'has_windspeed': auxsensbits[0],
-               'has_winddir': auxsensbits[1],
-               'has_rainrate': auxsensbits[2]}
+    if auxsenscode is None:  # MET files of structver 1 do not contain an auxiliary sensor code
+        return {'has_windspeed': 0,
+                'has_winddir': 0,
+                'has_rainrate': 0}
+
+    # extract the three used bits directly by shift and mask instead of unpacking all bits of the code
+    auxsenscode = int(auxsenscode)
+    out = {'has_windspeed': np.uint8(auxsenscode & 1),
+           'has_winddir': np.uint8((auxsenscode >> 1) & 1),
+           'has_rainrate': np.uint8((auxsenscode >> 2) & 1)}
 
     return out
 
@@ -108,15 +99,10 @@ def interpret_met_auxsens_code(auxsenscode):
 def interpret_hkd_contents_code(contents_code_integer):
     """interpret the integer contents code from HKD files and return dict of contents variables"""
 
-    contents_code_int8 = np.array([contents_code_integer]).view(np.uint8)
-    hkdselbits = np.unpackbits(contents_code_int8, bitorder='little')
-
-    out = {'has_coord': hkdselbits[0],
-           'has_T': hkdselbits[1],
-           'has_stability': hkdselbits[2],
-           'has_flashmemoryinfo': hkdselbits[3],
-           'has_qualityflag': hkdselbits[4],
-           'has_statusflag': hkdselbits[5]}
+    # extract the six used bits directly by shift and mask instead of unpacking all bits of the code
+    contents_code_integer = int(contents_code_integer)
+    contents_vars = ['has_coord', 'has_T', 'has_stability', 'has_flashmemoryinfo', 'has_qualityflag', 'has_statusflag']
+    out = {var: np.uint8((contents_code_integer >> nth_bit) & 1) for nth_bit, var in enumerate(contents_vars)}
 
     return out
 
@@ -130,28 +116,32 @@ def interpret_statusflag(flag_integer):
     ind_start_qc_hum = 0  # index of start of frequency channel quality flag for humidity receiver
     ind_start_qc_temp = 8  # index of start of frequency channel quality flag for temperature receiver
 
-    statusflagbits = flag_int2bits(flag_integer)
+    # extract the used bits directly by bitmask on the whole time series instead of unpacking all 32 bits first
+    flag_integer = np.atleast_1d(np.squeeze(flag_integer))
+    channel_bits = np.arange(n_channels_rec)  # one bit per channel of a receiver, offset by ind_start_qc_*
 
     # interpret the different bits according to the manual
-    tstabflag_hum = statusflagbits[:, 24] + 2 * statusflagbits[:, 25]
-    tstabflag_temp = statusflagbits[:, 26] + 2 * statusflagbits[:, 27]
+    tstabflag_hum = (flag_integer >> 24) & 0b11  # 2-bit field
+    tstabflag_temp = (flag_integer >> 26) & 0b11  # 2-bit field
     out = {
         'channels_rec': np.arange(n_channels_rec),  # needed as dim for channel_quality_ok_hum and channel_quality_ok_temp
-        'channel_quality_ok_hum': statusflagbits[:, ind_start_qc_hum:(ind_start_qc_hum + n_channels_rec)],
-        'channel_quality_ok_temp': statusflagbits[:, ind_start_qc_temp:(ind_start_qc_temp + n_channels_rec)],
-        'rainflag': statusflagbits[:, 16],
-        'blowerspeed_status': statusflagbits[:, 17],
-        'BLscan_active': statusflagbits[:, 18],
-        'tipcal_active': statusflagbits[:, 19],
-        'gaincal_active': statusflagbits[:, 20],
-        'noisecal_active': statusflagbits[:, 21],
-        'noisediode_ok_hum': statusflagbits[:, 22],
-        'noisediode_ok_temp': statusflagbits[:, 23],
+        'channel_quality_ok_hum': ((flag_integer[:, np.newaxis] >> (ind_start_qc_hum + channel_bits)) & 1).astype(
+            np.uint8),
+        'channel_quality_ok_temp': ((flag_integer[:, np.newaxis] >> (ind_start_qc_temp + channel_bits)) & 1).astype(
+            np.uint8),
+        'rainflag': isbitset(flag_integer, 16).astype(np.uint8),
+        'blowerspeed_status': isbitset(flag_integer, 17).astype(np.uint8),
+        'BLscan_active': isbitset(flag_integer, 18).astype(np.uint8),
+        'tipcal_active': isbitset(flag_integer, 19).astype(np.uint8),
+        'gaincal_active': isbitset(flag_integer, 20).astype(np.uint8),
+        'noisecal_active': isbitset(flag_integer, 21).astype(np.uint8),
+        'noisediode_ok_hum': isbitset(flag_integer, 22).astype(np.uint8),
+        'noisediode_ok_temp': isbitset(flag_integer, 23).astype(np.uint8),
         'Tstab_ok_hum': interpret_tstab_flag(tstabflag_hum),
         'Tstab_ok_temp': interpret_tstab_flag(tstabflag_temp),
-        'recent_powerfailure': statusflagbits[:, 28],
-        'Tstab_ok_amb': interpret_tstab_flag(statusflagbits[:, 29]),
-        'noisediode_on': statusflagbits[:, 30]}
+        'recent_powerfailure': isbitset(flag_integer, 28).astype(np.uint8),
+        'Tstab_ok_amb': interpret_tstab_flag(isbitset(flag_integer, 29).astype(np.uint8)),
+        'noisediode_on': isbitset(flag_integer, 30).astype(np.uint8)}
 
     return out
 
@@ -175,10 +165,11 @@ def interpret_scanflag(flag_integer):
         ===================   ======================   ============================
     """
 
-    scanflagbits = flag_int2bits(flag_integer)
-    int_quadr = scanflagbits[:, 1] + 2 * scanflagbits[:, 2]
+    # extract the three used bits directly by bitmask instead of unpacking all bits of the flag
+    flag_integer = np.atleast_1d(np.squeeze(flag_integer))
+    int_quadr = isbitset(flag_integer, 1) + 2 * isbitset(flag_integer, 2)
     out = {
-        'rainflag': scanflagbits[:, 0],
+        'rainflag': isbitset(flag_integer, 0).astype(np.uint8),
         'scan_quadrant': interpret_quadrant_int(int_quadr)}
 
     return out
@@ -196,26 +187,24 @@ def interpret_tstab_flag(flag):
         2                    0                   not ok (T sensors differ by >0.3 K)
         ==================   =================   ==========================================================
     """
-    flag2tstab_ok = {0: np.nan, 1: 1, 2: 0}  # correspondence of RPG stability flag (keys) with stability ok (value)
-    try:
-        if np.isscalar(flag):
-            return flag2tstab_ok[flag]
-        else:
-            return np.array([flag2tstab_ok[el] for el in flag])
-    except KeyError as err:
-        raise UnknownFlagValue('Expected 0, 1 or 2 for RPG temperature stability flag but found {}'.format(err))
+    flag2tstab_ok = np.array([np.nan, 1, 0])  # stability ok (value) for RPG stability flag (index)
+    flag = np.asarray(flag)
+    ind_unknown = (flag < 0) | (flag >= len(flag2tstab_ok))
+    if ind_unknown.any():
+        raise UnknownFlagValue('Expected 0, 1 or 2 for RPG temperature stability flag but found {}'.format(
+            flag[ind_unknown].ravel()[0]))
+    return flag2tstab_ok[flag]  # lookup for all elements at once
 
 
 def interpret_quadrant_int(int_quadr):
     """helper function for interpret scanflag for interpreting 2nd and 3rd bit (as int). See documentation from there"""
-    int2quadrant = {0: 1, 1: 2, 2: 0}  # correspondence of int(2nd and 3rd bit) (keys) with quadrant (value)
-    try:
-        if np.isscalar(int_quadr):
-            int2quadrant[int_quadr]
-        else:
-            return np.array([int2quadrant[el] for el in int_quadr])
-    except KeyError as err:
-        raise UnknownFlagValue('Expected 0, 1 or 2 for scan quadrant encoding but found {}'.format(err))
+    int2quadrant = np.array([1, 2, 0])  # quadrant (value) for int(2nd and 3rd bit) (index)
+    int_quadr = np.asarray(int_quadr)
+    ind_unknown = (int_quadr < 0) | (int_quadr >= len(int2quadrant))
+    if ind_unknown.any():
+        raise UnknownFlagValue('Expected 0, 1 or 2 for scan quadrant encoding but found {}'.format(
+            int_quadr[ind_unknown].ravel()[0]))
+    return int2quadrant[int_quadr]  # lookup for all elements at once
 
 
 def interpret_bit_order(bit_order):
@@ -228,22 +217,3 @@ def interpret_bit_order(bit_order):
         return 'big'
     else:
         raise ValueError("argument bit_order can receive '<', '>', 'little' or 'big' but got " + bit_order)
-
-
-def flag_int2bits(flag_integer):
-    """transform an integer value to bits. Input can be time series or scalars"""
-    # format input to a 2d numpy array with all data along first dim
-    if len(np.shape(flag_integer)) == 0:  # input is scalar
-        flag_integer = np.array([[flag_integer]])
-    elif not isinstance(flag_integer, np.ndarray):
-        raise WrongInputFormat('input must either be a numpy array or a scalar')
-    elif np.ndim(np.squeeze(flag_integer)) > 1:
-        raise WrongInputFormat('input can only be vector or scalar but not matrix')
-    elif len(flag_integer) == 1:  # input is numpy array with just one input (will be made scalar by numpy squeeze)
-        flag_integer = np.squeeze(flag_integer)[np.newaxis, np.newaxis]
-    else:  # input is column or row vector
-        flag_integer = np.squeeze(flag_integer)[:, np.newaxis]
-
-    # transform integer (time series) to flag bits
-    flag_int8 = flag_integer.view(np.uint8)
-    return np.unpackbits(flag_int8, axis=1, bitorder='little')
@@ -1,4 +1,4 @@
-import glob
+import mmap
 import os
 import pickle
 from itertools import groupby
@@ -19,10 +19,24 @@ def abs_file_path(*file_path):
     return Path(mwr_raw2l1.__file__).parent.parent / path
 
 
-def get_binary(filename):
-    """return the entire content of the binary file as binary stream"""
+def get_binary(filename, use_mmap=False):
+    """return the entire content of the binary file as binary stream (:class:`bytearray` or memory map)
+
+    Args:
+        filename: path of the binary file
+        use_mmap (optional): if True a read-only memory map of the file is returned instead of reading its content into
+            memory. Its pages are only loaded when accessed. The caller is responsible for closing the map once no
+            arrays created from it with :func:`numpy.frombuffer` are needed anymore, otherwise the file stays open.
+            Empty files are never mapped. Defaults to False.
+    """
     with open(filename, 'rb') as f:
-        return f.read()
+        size = os.fstat(f.fileno()).st_size
+        if use_mmap and size > 0:  # mmap cannot map empty files
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        content = bytearray(size)  # read into preallocated buffer instead of growing and copying chunks
+        n_read = f.readinto(content)
+        del content[n_read:]  # only has an effect if file was truncated in the meantime
+        return content
 
 
 def pickle_load(filename):
@@ -65,7 +79,11 @@ def get_files(dir_in, basename, time_start=None, time_end=None):
         list of files in dictionary corresponding to basename and time criteria
     """
 
-    files = glob.glob(os.path.join(dir_in, basename + '*'))
+    # single directory scan comparing plain filename prefixes (like glob with basename + '*', but no pattern matching)
+    files = []
+    if os.path.isdir(dir_in):  # return empty list for non-existing directories like glob
+        with os.scandir(dir_in) as entries:
+            files = [entry.path for entry in entries if entry.name.startswith(basename) and entry.is_file()]
 
     if time_start is None and time_end is None:
         return files
@@ -0,0 +1,100 @@
+"""unit tests for helper functions constructing the datasets of the Measurement class
+
+Features tested:
+- drop duplicates in time vector containing repeated timestamps and NaT
+- concatenate data dictionaries to single dataset with optional variables only present in some of the dictionaries
+- concatenate data dictionaries to single dataset with differing non-time dimensions (fallback to xarray concat)
+- concatenate data dictionaries to single dataset with scalar variables (fallback to xarray concat)
+"""
+
+import unittest
+
+import numpy as np
+import xarray as xr
+
+from mwr_raw2l1.measurement.measurement_construct_helpers import (concat_data_dicts, drop_duplicates, make_dataset,
+                                                                  to_single_dataset)
+
+
+class TestDropDuplicates(unittest.TestCase):
+    """Test removal of duplicate times"""
+
+    def test_nat_and_repeated_times(self):
+        """Test first occurrence of each time is kept, output is sorted by time and NaT is kept only once"""
+        time = np.array(['NaT', '2020-01-01T06', '2020-01-01T09', '2020-01-01T06', '2020-01-01T02', '2020-01-01T02',
+                         'NaT'], dtype='datetime64[ns]')
+        ds = xr.Dataset({'var': ('time', np.arange(len(time)))}, coords={'time': time})
+        ds.get_index('time').is_monotonic_increasing  # evaluate like xarray can do e.g. in sel before dropping
+
+        out = drop_duplicates(ds, 'time')
+
+        np.testing.assert_array_equal(out['var'].values, [4, 1, 2, 0])
+        np.testing.assert_array_equal(out['time'].values, time[[4, 1, 2, 0]])
+
+    def test_sorted_repeated_times(self):
+        """Test duplicates are removed from sorted time vector"""
+        time = np.array(['2020-01-01T02', '2020-01-01T02', '2020-01-01T06', '2020-01-01T09', '2020-01-01T09'],
+                        dtype='datetime64[ns]')
+        ds = xr.Dataset({'var': ('time', np.arange(len(time)))}, coords={'time': time})
+
+        out = drop_duplicates(ds, 'time')
+
+        np.testing.assert_array_equal(out['var'].values, [0, 2, 3])
+
+
+class TestToSingleDataset(unittest.TestCase):
+    """Test concatenation of data dictionaries from several files to a single dataset"""
+
+    dims = ['time', 'frequency']
+
+    def test_optional_var_in_some_files(self):
+        """Test optional variable present in some files is NaN-filled for the others and the absent one is all-NaN"""
+        vars = ['Tb']
+        vars_opt = ['T', 'rainflag']
+        data_dicts = [self.make_data(['2020-01-01T00', '2020-01-01T01'], [22.2, 23.0], T=[280., 281.]),
+                      self.make_data(['2020-01-01T01', '2020-01-01T02'], [22.2, 23.0])]
+
+        out = to_single_dataset(data_dicts, self.dims, vars, vars_opt)
+
+        xr.testing.assert_identical(out, self.reference(data_dicts, vars, vars_opt))
+        np.testing.assert_array_equal(out['T'].values, [280., 281., np.nan])
+        self.assertTrue(out['rainflag'].isnull().all())
+
+    def test_differing_dims(self):
+        """Test files with different frequencies are merged by xarray as arrays cannot be concatenated directly"""
+        vars = ['Tb']
+        data_dicts = [self.make_data(['2020-01-01T00', '2020-01-01T01'], [22.2, 23.0]),
+                      self.make_data(['2020-01-01T02'], [22.2, 23.0, 23.8])]
+
+        out = to_single_dataset(data_dicts, self.dims, vars)
+
+        self.assertIsNone(concat_data_dicts(data_dicts, self.dims, vars))
+        xr.testing.assert_identical(out, self.reference(data_dicts, vars))
+        self.assertEqual(out['Tb'].shape, (3, 3))
+        self.assertTrue(out['Tb'].sel(frequency=23.8).isel(time=[0, 1]).isnull().all())
+
+    def test_scalar_var(self):
+        """Test files with scalar (time-less) variables are merged by xarray"""
+        vars = ['Tb', 'lat']
+        data_dicts = [self.make_data(['2020-01-01T00', '2020-01-01T01'], [22.2, 23.0], lat=46.8),
+                      self.make_data(['2020-01-01T02'], [22.2, 23.0], lat=46.8)]
+
+        out = to_single_dataset(data_dicts, self.dims, vars)
+
+        self.assertIsNone(concat_data_dicts(data_dicts, self.dims, vars))
+        xr.testing.assert_identical(out, self.reference(data_dicts, vars))
+
+    # Helper methods
+    # --------------
+    def reference(self, data_dicts, vars, vars_opt=None):
+        """reference output generating a dataset for each data dictionary and merging them with xarray"""
+        datasets = [make_dataset(dat.copy(), self.dims, vars, vars_opt) for dat in data_dicts]
+        return drop_duplicates(xr.concat(datasets, dim='time'), 'time')
+
+    @staticmethod
+    def make_data(time, frequency, **kwargs):
+        """make data dictionary with Tb of dims (time, frequency) and further variables given as keyword arguments"""
+        data = {'time': np.array(time, dtype='datetime64[ns]'), 'frequency': np.array(frequency)}
+        data['Tb'] = np.arange(len(time) * len(frequency), dtype=np.float64).reshape(len(time), len(frequency))
+        data.update({var: np.array(val) for var, val in kwargs.items()})
+        return data
@@ -5,17 +5,21 @@ Features tested:
 - check main runs error-free for extra line (to be ignored) after header in data file
 - check exception is raised if no header is present in data file
 - check exception is raised if data file does not contain column header info for one record type in the data file
+- check read-in of ragged data lines whose number of fields differs per record type (and from the column header)
 """
 
 import glob
 import os
+import tempfile
 import unittest
 
+import numpy as np
 import xarray as xr
 
 from mwr_raw2l1.errors import CorruptRectype, MissingData, MissingHeader, MWRTestError, UnknownRecordType
 from mwr_raw2l1.log import logger
 from mwr_raw2l1.main import run
+from mwr_raw2l1.readers.reader_radiometrics import N_COLS_EXTRA, Reader
 from mwr_raw2l1.utils.file_utils import abs_file_path
 from tests.helper_functions import add_suffix, make_test_config
 
@@ -171,3 +175,57 @@ class TestRadiometrics(unittest.TestCase):
             for attname in ['network_name', 'license', 'history']:
                 self.assertIn(attname, self.ds.attrs)
             self.assertIn('raw2l1', self.ds.attrs['history'].lower())
+
+
+class TestRadiometricsRaggedLines(unittest.TestCase):
+    """Test read-in of data lines of different length in the same file"""
+
+    header_lines = ['Record,Date/Time,40,Tamb(K),Rh(%)',
+                    'Record,Date/Time,50,Az(deg),El(deg),Ch  22.000,Ch  23.000,Ch  24.000']
+
+    def test_ragged_lines(self):
+        """Test lines are padded per record type and lines longer than their column header are kept entirely"""
+        data_lines = ['1,01/31/21 00:04:08,41,281.1,50.2',
+                      '2,01/31/21 00:04:09,51,0.00,90.00,15.1,,17.3',
+                      '3,01/31/21 00:05:08,41,281.2,',
+                      '4,01/31/21 00:05:09,51,0.00,90.00,15.2,16.2,17.2,1']
+        rd = self.read_lines(self.header_lines + data_lines)
+
+        self.assertEqual(rd.data_raw[40].shape, (2, 5))
+        self.assertEqual(rd.data_raw[50].shape, (2, 9))
+        np.testing.assert_array_equal(rd.data_raw[40][:, 4].astype(float), [50.2, np.nan])
+        np.testing.assert_array_equal(rd.data_raw[50][:, 6].astype(float), [np.nan, 16.2])
+        np.testing.assert_array_equal(rd.data_raw[50][:, 8].astype(float), [np.nan, 1])
+
+    def test_line_of_unknown_rectype_longer_than_all_headers(self):
+        """Test that the error for the unknown record type is raised also if the line exceeds the expected width"""
+        data_lines = ['1,01/31/21 00:04:08,41,281.1,50.2',
+                      '2,01/31/21 00:04:09,61' + ',0' * (len(self.header_lines[1].split(',')) + N_COLS_EXTRA)]
+        with self.assertRaisesRegex(UnknownRecordType, 'number 61 .* number 60'):
+            self.read_lines(self.header_lines + data_lines)
+
+    def test_first_parsed_line_longer_than_expected(self):
+        """Test a line of known record type exceeding the expected width is read entirely also as first parsed line"""
+        n_fields_long = len(self.header_lines[1].split(',')) + N_COLS_EXTRA + 2
+        data_lines = ['1,01/31/21 00:04:08,41,281.1,50.2',  # first data line is consumed together with the header
+                      '2,01/31/21 00:04:09,51,0.00,90.00,15.1,16.1,17.1' + ',1' * (n_fields_long - 8),
+                      '3,01/31/21 00:05:08,41,281.2,',
+                      '4,01/31/21 00:05:09,51,0.00,90.00,15.2,16.2,17.2']
+        rd = self.read_lines(self.header_lines + data_lines)
+
+        self.assertEqual(rd.data_raw[50].shape, (2, n_fields_long))
+        np.testing.assert_array_equal(rd.data_raw[50][:, 0], ['2', '4'])
+        np.testing.assert_array_equal(rd.data_raw[50][:, 5].astype(float), [15.1, 15.2])
+        np.testing.assert_array_equal(rd.data_raw[50][:, -1].astype(float), [1, np.nan])
+        np.testing.assert_array_equal(rd.data_raw[40][:, 3].astype(float), [281.1, 281.2])
+
+    @staticmethod
+    def read_lines(lines):
+        """write lines to a temporary file and return :class:`Reader` instance after read-in of this file"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'ragged_lv1.csv')
+            with open(filename, 'w') as f:
+                f.write('\n'.join(lines) + '\n')
+            rd = Reader(filename)
+            rd.read()
+        return rd
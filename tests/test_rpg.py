@@ -13,6 +13,7 @@ Features tested:
 - check run for missing met file
 - check exception is raised if no brightness temperature files are available (brt or blb)
 - check exception is raised if no housekeeping data (hkd) file is available
+- check reading many files while keeping the read-in data does not exhaust file descriptors
 """
 
 import glob
@@ -25,9 +26,15 @@ import xarray as xr
 from mwr_raw2l1.errors import MissingDataSource, MWRTestError
 from mwr_raw2l1.log import logger
 from mwr_raw2l1.main import run
+from mwr_raw2l1.readers.reader_rpg import read_multiple_files
 from mwr_raw2l1.utils.file_utils import abs_file_path
 from tests.helper_functions import make_test_config, check_outdir_empty
 
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
 # list of variables to ignore in each test (best practice: only use for updating tests, otherwise set in sub-tests)
 VARS_TO_IGNORE_GLOBAL = []
 
@@ -270,3 +277,26 @@ class TestRPGLhatpro(TestRPGHatpro):
                     'single IR wavelength is assumed to set the dimensions in the output file what would trigger a '
                     'dimension mismatch with the reference output file.')
         pass
+
+
+class TestRPGFileHandles(unittest.TestCase):
+    """Check that no file handle remains open after read-in of RPG files"""
+
+    @unittest.skipIf(resource is None, 'resource module only available on Unix')
+    def test_read_many_files(self):
+        """Read all HATPRO test files repeatedly and keep the data with a low limit on open file descriptors"""
+        n_fd_margin = 32  # less than the number of files read below
+        n_repeat = 10
+        files = glob.glob(os.path.join(path_data_files_in_hatpro, '*'))
+
+        with open(os.devnull) as f:  # lowest free file descriptor gives the number of descriptors in use
+            fd_next = f.fileno()
+        limits_orig = resource.getrlimit(resource.RLIMIT_NOFILE)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (fd_next + n_fd_margin, limits_orig[1]))
+        try:
+            all_data = [read_multiple_files(files) for _ in range(n_repeat)]
+        finally:
+            resource.setrlimit(resource.RLIMIT_NOFILE, limits_orig)
+
+        self.assertGreater(n_repeat * len(files), n_fd_margin)
+        self.assertEqual(len(all_data), n_repeat)